@@ -28,6 +28,10 @@ class Config(BaseConfig):
     SECRET_KEY: str = Field(env='SECRET_KEY', default=None)
     SECURITY_PASSWORD_SALT: str = Field(env='SECURITY_PASSWORD_SALT', default=None)
 
+    # Werkzeug hash method for stored passwords. Overridable so tests can use a
+    # minimal scrypt cost (e.g. 'scrypt:2:8:1') instead of the production one.
+    PASSWORD_HASH_METHOD: str = Field(env='PASSWORD_HASH_METHOD', default='scrypt')
+
     VUE_APP_URI: str = Field(env='VUE_APP_URI', default=None)
 
     POSTGRES_HOST: str = Field(env='POSTGRES_HOST')
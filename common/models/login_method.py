@@ -4,6 +4,8 @@ import string
 
 from werkzeug.security import generate_password_hash
 
+from common.app_config import config
+
 from rococo.models.login_method import LoginMethodType
 from rococo.models.versioned_model import ModelValidationError
 from rococo.models import LoginMethod as BaseLoginMethod
@@ -21,7 +23,7 @@ class LoginMethod(BaseLoginMethod):
     def hash_password(self):
         if self.raw_password is not None:
             self.validate_raw_password()
-            self.password = generate_password_hash(self.raw_password, method='scrypt')
+            self.password = generate_password_hash(self.raw_password, method=config.PASSWORD_HASH_METHOD)
         del self.raw_password
 
     def validate_raw_password(self):
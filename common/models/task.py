@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from datetime import datetime
+
 from rococo.models.versioned_model import VersionedModel
 
 
@@ -8,3 +10,30 @@ class Task(VersionedModel):
     title: str = None
     completed: bool = False
 
+    def as_dict(self, convert_datetime_to_iso_string: bool = False, convert_uuids: bool = True):
+        """
+        Closed-form serialization for the known Task columns.
+
+        Skips the per-field metadata walk of VersionedModel.as_dict - this runs
+        once per task on every GET /tasks response. The id columns are already
+        stored as 32-char hex strings, so convert_uuids has nothing to convert.
+        """
+        if self._is_partial:
+            return {'entity_id': self.entity_id}
+
+        changed_on = self.changed_on
+        if convert_datetime_to_iso_string and isinstance(changed_on, datetime):
+            changed_on = changed_on.isoformat()
+
+        return {
+            'entity_id': self.entity_id,
+            'version': self.version,
+            'previous_version': self.previous_version,
+            'active': self.active,
+            'changed_by_id': self.changed_by_id,
+            'changed_on': changed_on,
+            'person_id': self.person_id,
+            'title': self.title,
+            'completed': self.completed,
+        }
+
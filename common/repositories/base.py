@@ -1,7 +1,8 @@
 from rococo.repositories.postgresql import PostgreSQLRepository
 from rococo.data.postgresql import PostgreSQLAdapter
 from rococo.messaging.base import MessageAdapter
-from typing import Optional
+from rococo.models.versioned_model import VersionedModel
+from typing import List, Optional
 
 
 class BaseRepository(PostgreSQLRepository):
@@ -13,8 +14,30 @@ class BaseRepository(PostgreSQLRepository):
             raise TypeError(f"Subclasses of {cls.__name__} must define the MODEL attribute.")
 
     def __init__(
-            self, db_adapter: PostgreSQLAdapter, message_adapter: Optional[MessageAdapter], 
+            self, db_adapter: PostgreSQLAdapter, message_adapter: Optional[MessageAdapter],
             queue_name: str, user_id: str = None
     ):
         # Pass MODEL as the model to the BaseRepository
         super().__init__(db_adapter, self.MODEL, message_adapter, queue_name, user_id=user_id)
+
+    def save_many(self, instances: List[VersionedModel]):
+        """
+        Save a batch of models in a single transaction.
+
+        Builds the same audit-move + upsert statement pair that save() issues for
+        one instance, but runs the whole batch through one run_transaction call,
+        so N saves cost one connection checkout and one commit instead of N.
+        """
+        if not instances:
+            return instances
+
+        queries = []
+        for instance in instances:
+            data = self._process_data_before_save(instance)
+            queries.append(self.adapter.get_move_entity_to_audit_table_query(self.table_name, instance.entity_id))
+            queries.append(self.adapter.get_save_query(self.table_name, data))
+
+        with self.adapter:
+            self.adapter.run_transaction(queries)
+
+        return instances
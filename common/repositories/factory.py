@@ -69,6 +69,7 @@ class RepositoryFactory:
 
     def __init__(self, config):
         self.config = config
+        self._db_adapter = None
 
     _repositories = {
         RepoType.PERSON: PersonRepository,
@@ -80,13 +81,21 @@ class RepositoryFactory:
     }
 
     def get_db_connection(self):
+        # One adapter per factory is enough: the adapter only checks a connection
+        # out (via the pooled resolver, when available) inside each `with` block,
+        # and repositories obtained from a factory are used sequentially. The
+        # actual sockets are pooled by PooledConnectionPlugin per app context.
+        if self._db_adapter is not None:
+            return self._db_adapter
+
         host = self.config.POSTGRES_HOST
         port = int(self.config.POSTGRES_PORT)
         user = self.config.POSTGRES_USER
         password = self.config.POSTGRES_PASSWORD
         database = self.config.POSTGRES_DB
 
-        return PostgreSQLAdapter(host, port, user, password, database, connection_resolver=get_connection_resolver(), connection_closer=get_connection_closer())
+        self._db_adapter = PostgreSQLAdapter(host, port, user, password, database, connection_resolver=get_connection_resolver(), connection_closer=get_connection_closer())
+        return self._db_adapter
 
     def _get_rabbitmq_connection(self):
         return RabbitMqConnection(
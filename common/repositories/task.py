@@ -5,22 +5,37 @@ from common.models.task import Task
 class TaskRepository(BaseRepository):
     MODEL = Task
 
-    def get_tasks_by_person_id_ordered(self, person_id: str):
-        query = """
-            SELECT *
-            FROM task
-            WHERE person_id = %s AND active = true
-            ORDER BY changed_on DESC;
+    # Built once at class definition so each call skips re-assembling the SQL
+    # string; psycopg2 interpolates parameters client-side and sends a plain
+    # statement, so the saving is purely on this side of the wire.
+    TASKS_BY_PERSON_ID_ORDERED_QUERY = """
+        SELECT *
+        FROM task
+        WHERE person_id = %s AND active = true
+        ORDER BY changed_on DESC;
+    """
+
+    @classmethod
+    def _task_from_row(cls, row):
+        """
+        Hydrate a Task straight from a result row.
+
+        Rows come back as plain dicts keyed exactly by the task columns, so the
+        values are written directly into the instance __dict__, skipping both
+        __init__/__post_init__ and per-attribute descriptor dispatch. _is_partial
+        is normally set by __post_init__ and has to be seeded by hand here.
         """
+        task = cls.MODEL.__new__(cls.MODEL)
+        task.__dict__['_is_partial'] = False
+        task.__dict__.update(row)
+        return task
+
+    def get_tasks_by_person_id_ordered(self, person_id: str):
         params = (person_id,)
 
         with self.adapter:
-            results = self.adapter.execute_query(query, params)
-            tasks = []
-            for row in results:
-                task = self.MODEL()
-                for key, value in row.items():
-                    setattr(task, key, value)
-                tasks.append(task)
-            return tasks
+            results = self.adapter.execute_query(self.TASKS_BY_PERSON_ID_ORDERED_QUERY, params)
 
+        # Hydrate lazily: the rows themselves are already fetched, so the generator
+        # only defers model construction, sparing a second full-list allocation here.
+        return (self._task_from_row(row) for row in results)
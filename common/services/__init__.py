@@ -1,8 +1,8 @@
-from .person import PersonService
+from .person import PersonService, get_person_service
 from .email import EmailService
 from .login_method import LoginMethodService
 from .organization import OrganizationService
 from .person_organization_role import PersonOrganizationRoleService
 from .auth import AuthService
 from .oauth import OAuthClient
-from .task import TaskService
\ No newline at end of file
+from .task import TaskService, get_task_service
\ No newline at end of file
@@ -2,6 +2,31 @@ from common.repositories.factory import RepositoryFactory, RepoType
 from common.models.person import Person
 
 
+def get_person_service(config):
+    """
+    Return a PersonService for the current request, constructing it at most once per request.
+
+    Within a request the instance is cached on `flask.g`; the cache is request-scoped
+    rather than module-scoped because the repository captures the authenticated user id
+    for auditing at construction time. Outside of a request context (e.g. tests, workers)
+    a fresh instance is returned.
+    """
+    try:
+        from flask import g, has_request_context
+
+        if has_request_context():
+            service = getattr(g, '_person_service', None)
+            if service is None:
+                service = PersonService(config)
+                g._person_service = service
+            return service
+    except ImportError:
+        # Flask is not installed; fall through to a plain instance.
+        pass
+
+    return PersonService(config)
+
+
 class PersonService:
 
     def __init__(self, config):
@@ -27,4 +52,18 @@ class PersonService:
 
     def get_person_by_id(self, entity_id: str):
         person = self.person_repo.get_one({"entity_id": entity_id})
+        return person
+
+    def update_name(self, entity_id: str, first_name: str = None, last_name: str = None):
+        person = self.person_repo.get_one({"entity_id": entity_id})
+        if not person:
+            return None
+
+        if first_name is not None:
+            person.first_name = first_name
+
+        if last_name is not None:
+            person.last_name = last_name
+
+        person = self.person_repo.save(person)
         return person
\ No newline at end of file
@@ -1,6 +1,65 @@
+import time
+
 from common.repositories.factory import RepositoryFactory, RepoType
 from common.models.task import Task
 
+# Short-TTL, process-local cache of task lists keyed by person_id. It lives at
+# the service layer rather than the HTTP layer so that any write going through
+# the service (views, workers, tests) invalidates it.
+_TASK_LIST_CACHE = {}
+TASK_LIST_CACHE_TTL_SECONDS = 30
+
+
+def _get_cached_task_list(person_id):
+    entry = _TASK_LIST_CACHE.get(person_id)
+    if entry is None:
+        return None
+
+    expires_at, tasks = entry
+    if time.monotonic() >= expires_at:
+        _TASK_LIST_CACHE.pop(person_id, None)
+        return None
+
+    return tasks
+
+
+def _cache_task_list(person_id, tasks):
+    _TASK_LIST_CACHE[person_id] = (time.monotonic() + TASK_LIST_CACHE_TTL_SECONDS, tasks)
+
+
+def invalidate_task_list_cache(person_id=None):
+    """Drop the cached task list for one person, or for everyone when no id is given."""
+    if person_id is None:
+        _TASK_LIST_CACHE.clear()
+    else:
+        _TASK_LIST_CACHE.pop(person_id, None)
+
+
+def get_task_service(config):
+    """
+    Return a TaskService for the current request, constructing it at most once per request.
+
+    The service graph (service -> factory -> repository) is rebuilt on every handler call
+    otherwise; within a request it is cached on `flask.g`. The cache is request-scoped
+    rather than module-scoped because the repository captures the authenticated user id
+    for auditing at construction time. Outside of a request context (e.g. tests, workers)
+    a fresh instance is returned.
+    """
+    try:
+        from flask import g, has_request_context
+
+        if has_request_context():
+            service = getattr(g, '_task_service', None)
+            if service is None:
+                service = TaskService(config)
+                g._task_service = service
+            return service
+    except ImportError:
+        # Flask is not installed; fall through to a plain instance.
+        pass
+
+    return TaskService(config)
+
 
 class TaskService:
 
@@ -11,18 +70,55 @@ class TaskService:
 
     def save_task(self, task: Task):
         task = self.task_repo.save(task)
+        invalidate_task_list_cache(task.person_id)
         return task
 
+    def save_tasks(self, tasks: list):
+        tasks = self.task_repo.save_many(tasks)
+        for task in tasks:
+            invalidate_task_list_cache(task.person_id)
+        return tasks
+
     def get_task_by_id(self, entity_id: str):
         task = self.task_repo.get_one({"entity_id": entity_id})
         return task
 
     def get_tasks_by_person_id(self, person_id: str):
-        tasks = self.task_repo.get_tasks_by_person_id_ordered(person_id)
+        tasks = _get_cached_task_list(person_id)
+        if tasks is None:
+            # The repository hydrates lazily; materialize once so the result is cacheable.
+            tasks = list(self.task_repo.get_tasks_by_person_id_ordered(person_id))
+            _cache_task_list(person_id, tasks)
         return tasks
 
+    def update_task(self, task_id: str, person_id: str, title: str = None, completed: bool = None):
+        # The person_id condition folds the ownership check into the lookup itself,
+        # so a task belonging to another user is indistinguishable from a missing one.
+        task = self.task_repo.get_one({"entity_id": task_id, "person_id": person_id})
+        if not task:
+            return None
+
+        if title is not None:
+            task.title = title
+
+        if completed is not None:
+            task.completed = completed
+
+        task = self.task_repo.save(task)
+        invalidate_task_list_cache(person_id)
+        return task
+
     def delete_task(self, task: Task):
         task.active = False
         task = self.task_repo.save(task)
+        invalidate_task_list_cache(task.person_id)
         return task
 
+    def delete_task_by_id(self, task_id: str, person_id: str):
+        # Ownership is folded into the lookup conditions, mirroring update_task.
+        task = self.task_repo.get_one({"entity_id": task_id, "person_id": person_id})
+        if not task:
+            return None
+
+        return self.delete_task(task)
+
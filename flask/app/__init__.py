@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from flask import Flask, g, Request
 from flask_restx import Api
 from flask_cors import CORS
@@ -24,12 +26,22 @@ api = Api(
     doc='/api-doc'
 )
 
+@lru_cache(maxsize=None)
 def create_app():
+    # Memoized: the configuration comes from the environment via get_config(),
+    # so within one process every call would build an identical app. Reusing
+    # the first instance skips the Flask/Flask-RESTX bootstrap on repeat calls
+    # (e.g. one app fixture per test module) and makes the namespace
+    # re-registration guard below moot for callers of this factory.
     config = get_config()
 
     app = Flask(__name__)
     app.config.from_object(config)
 
+    # Serialize responses with orjson instead of the stdlib json module.
+    from app.helpers.json import ORJSONProvider
+    app.json = ORJSONProvider(app)
+
     with app.app_context():
         set_request_exception_signal(app)
 
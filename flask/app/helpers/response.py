@@ -1,4 +1,7 @@
+import orjson
+
 from flask import current_app as app
+from app.helpers.json import json_default
 from common.helpers.exceptions import InputValidationError
 
 
@@ -17,8 +20,13 @@ def validate_required_fields(required_fields):
 
 
 def _get_response(data, status_code=200):
+    # Every API response goes through here, so serialize with orjson directly
+    # (bytes out, C-level datetime/UUID handling) instead of dispatching
+    # through app.json, using the same json_default the provider uses so model
+    # dataclasses serialize identically on both paths. The provider registered
+    # on the app stays the fallback for anything Flask serializes on its own.
     response = app.response_class(
-        response=app.json.dumps(data),
+        response=orjson.dumps(data, default=json_default),
         status=status_code,
         mimetype=app.config['MIME_TYPE']
     )
@@ -26,10 +34,12 @@ def _get_response(data, status_code=200):
 
 
 def get_failure_response(message, status_code=200):
-    response = _get_response(dict(success=False, message=message), status_code)
+    response = _get_response({'success': False, 'message': message}, status_code)
     return response
 
 
 def get_success_response(status_code=200, **data):
-    response = _get_response(dict(success=True, **data), status_code)
+    # Tag the kwargs dict in place; dict(success=True, **data) would copy it.
+    data['success'] = True
+    response = _get_response(data, status_code)
     return response
@@ -0,0 +1,17 @@
+def require_nonempty(field_name, value):
+    """
+    Validate an optional string field from a request body.
+
+    Returns a (cleaned_value, error_message) pair: (None, None) when the field
+    was not provided, (stripped_value, None) when it is a non-empty string, and
+    (None, message) otherwise. Validation failures are reported as return values
+    rather than exceptions so handlers can answer bad input with a plain early
+    return instead of paying for stack unwinding and errorhandler dispatch.
+    """
+    if value is None:
+        return None, None
+
+    if not isinstance(value, str) or not value.strip():
+        return None, f"'{field_name}' cannot be empty if provided."
+
+    return value.strip(), None
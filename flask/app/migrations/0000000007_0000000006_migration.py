@@ -0,0 +1,20 @@
+revision = "0000000007"
+down_revision = "0000000006"
+
+
+
+def upgrade(migration):
+    # write migration here
+    # Composite index matching the task-list query
+    # (WHERE person_id = ... AND active = true ORDER BY changed_on DESC),
+    # so Postgres returns rows in order instead of sorting them.
+    migration.add_index("task", "task_person_id_active_changed_on_ind", "person_id, active, changed_on DESC")
+
+    migration.update_version_table(version=revision)
+
+
+def downgrade(migration):
+    # write migration here
+    migration.remove_index("task", "task_person_id_active_changed_on_ind")
+
+    migration.update_version_table(version=down_revision)
@@ -1,9 +1,10 @@
 from flask_restx import Namespace, Resource, Model, fields
 from flask import request
-from app.helpers.response import get_success_response, parse_request_body
+from app.helpers.response import get_success_response, get_failure_response
+from app.helpers.validation import require_nonempty
 from app.helpers.decorators import login_required
 from common.app_config import config
-from common.services import PersonService
+from common.services import get_person_service
 from common.helpers.exceptions import InputValidationError
 
 # Create the organization blueprint
@@ -35,15 +36,11 @@ class Me(Resource):
         Returns:
             dict: Success response with person data
         """
-        person_service = PersonService(config)
-        
-        # Fetch the actual person from the database, not from token
-        db_person = person_service.get_person_by_id(person.entity_id)
-        
-        if not db_person:
-            raise InputValidationError("Person not found.")
-        
-        return get_success_response(person=db_person)
+        # The access token embeds the person data precisely so that authenticated
+        # reads skip the database (see generate_access_token); login_required has
+        # already hydrated `person` from it, so serve that directly. Name changes
+        # show up here once the client refreshes its token.
+        return get_success_response(person=person)
 
     @person_api.expect(update_person_model)
     @login_required()
@@ -63,39 +60,35 @@ class Me(Resource):
             dict: Success response with updated person data and confirmation message
         
         Raises:
-            InputValidationError: If no fields are provided, or if provided fields are empty
+            InputValidationError: If the authenticated person no longer exists
         """
-        parsed_body = parse_request_body(request, ["first_name", "last_name"], default_value=None)
-        
-        first_name = parsed_body.get("first_name")
-        last_name = parsed_body.get("last_name")
-        
+        body = request.get_json(silent=True) or {}
+
+        first_name = body.get("first_name")
+        last_name = body.get("last_name")
+
+        # Validation failures return directly rather than raising: bad input is a
+        # normal outcome here, not worth the exception-unwind/errorhandler path.
         if not first_name and not last_name:
-            raise InputValidationError("At least one of 'first_name' or 'last_name' must be provided.")
-        
-        if first_name is not None and (not first_name or not str(first_name).strip()):
-            raise InputValidationError("'first_name' cannot be empty if provided.")
-        
-        if last_name is not None and (not last_name or not str(last_name).strip()):
-            raise InputValidationError("'last_name' cannot be empty if provided.")
-        
-        person_service = PersonService(config)
-        
-        # Fetch the actual person from the database using the entity_id from the token
-        db_person = person_service.get_person_by_id(person.entity_id)
-        
-        if not db_person:
+            return get_failure_response("At least one of 'first_name' or 'last_name' must be provided.")
+
+        first_name, error = require_nonempty("first_name", first_name)
+        if error:
+            return get_failure_response(error)
+
+        last_name, error = require_nonempty("last_name", last_name)
+        if error:
+            return get_failure_response(error)
+
+        person_service = get_person_service(config)
+
+        saved_person = person_service.update_name(
+            person.entity_id,
+            first_name=first_name,
+            last_name=last_name
+        )
+
+        if not saved_person:
             raise InputValidationError("Person not found.")
-        
-        if first_name is not None:
-            db_person.first_name = first_name.strip()
-        
-        if last_name is not None:
-            db_person.last_name = last_name.strip()
-        
-        person_service.save_person(db_person)
-        
-        # Fetch the person again from database to ensure we return the latest saved version
-        saved_person = person_service.get_person_by_id(person.entity_id)
 
         return get_success_response(message="Name updated successfully.", person=saved_person)
@@ -1,9 +1,10 @@
 from flask_restx import Namespace, Resource, Model, fields
 from flask import request
-from app.helpers.response import get_success_response, parse_request_body, validate_required_fields
+from app.helpers.response import get_success_response, get_failure_response
+from app.helpers.validation import require_nonempty
 from app.helpers.decorators import login_required
 from common.app_config import config
-from common.services import TaskService
+from common.services import get_task_service
 from common.models.task import Task
 from common.helpers.exceptions import InputValidationError
 
@@ -41,7 +42,7 @@ class Tasks(Resource):
         Returns:
             dict: Success response with list of tasks
         """
-        task_service = TaskService(config)
+        task_service = get_task_service(config)
         tasks = task_service.get_tasks_by_person_id(person.entity_id)
         
         tasks_list = [task.as_dict() for task in tasks] if tasks else []
@@ -66,19 +67,22 @@ class Tasks(Resource):
         Raises:
             InputValidationError: If title is not provided or is empty
         """
-        parsed_body = parse_request_body(request, ["title"], default_value=None)
-        validate_required_fields(parsed_body)
-        
-        title = parsed_body.get("title")
-        
+        # get_json caches the parsed body on the request, so this is a single parse.
+        body = request.get_json(silent=True) or {}
+
+        # Validation failures return directly rather than raising: bad input is a
+        # normal outcome here, not worth the exception-unwind/errorhandler path.
+        title = body.get("title")
         if not title or not str(title).strip():
-            raise InputValidationError("'title' cannot be empty.")
-        
-        task_service = TaskService(config)
-        
+            return get_failure_response("'title' is required and cannot be empty.")
+
+        title = str(title).strip()
+
+        task_service = get_task_service(config)
+
         new_task = Task(
             person_id=person.entity_id,
-            title=title.strip(),
+            title=title,
             completed=False
         )
         
@@ -109,41 +113,34 @@ class TaskById(Resource):
         
         Returns:
             dict: Success response with updated task data and confirmation message
-        
+
         Raises:
-            InputValidationError: If task is not found, doesn't belong to user, or if provided title is empty
+            InputValidationError: If task is not found or doesn't belong to user
         """
-        parsed_body = parse_request_body(request, ["title", "completed"], default_value=None)
-        
-        title = parsed_body.get("title")
-        completed = parsed_body.get("completed")
-        
+        body = request.get_json(silent=True) or {}
+
+        title = body.get("title")
+        completed = body.get("completed")
+
         if title is None and completed is None:
-            raise InputValidationError("At least one of 'title' or 'completed' must be provided.")
-        
-        if title is not None and (not title or not str(title).strip()):
-            raise InputValidationError("'title' cannot be empty if provided.")
-        
-        task_service = TaskService(config)
-        
-        existing_task = task_service.get_task_by_id(task_id)
-        
-        if not existing_task:
+            return get_failure_response("At least one of 'title' or 'completed' must be provided.")
+
+        title, error = require_nonempty("title", title)
+        if error:
+            return get_failure_response(error)
+
+        task_service = get_task_service(config)
+
+        updated_task = task_service.update_task(
+            task_id,
+            person.entity_id,
+            title=title,
+            completed=bool(completed) if completed is not None else None
+        )
+
+        if not updated_task:
             raise InputValidationError("Task not found.")
-        
-        if existing_task.person_id != person.entity_id:
-            raise InputValidationError("You do not have permission to update this task.")
-        
-        if title is not None:
-            existing_task.title = title.strip()
-        
-        if completed is not None:
-            existing_task.completed = bool(completed)
-        
-        task_service.save_task(existing_task)
-        
-        updated_task = task_service.get_task_by_id(task_id)
-        
+
         return get_success_response(message="Task updated successfully.", task=updated_task.as_dict())
 
     @login_required()
@@ -159,21 +156,16 @@ class TaskById(Resource):
         
         Returns:
             dict: Success response with confirmation message
-        
+
         Raises:
             InputValidationError: If task is not found or doesn't belong to user
         """
-        task_service = TaskService(config)
-        
-        existing_task = task_service.get_task_by_id(task_id)
-        
-        if not existing_task:
+        task_service = get_task_service(config)
+
+        deleted_task = task_service.delete_task_by_id(task_id, person.entity_id)
+
+        if not deleted_task:
             raise InputValidationError("Task not found.")
-        
-        if existing_task.person_id != person.entity_id:
-            raise InputValidationError("You do not have permission to delete this task.")
-        
-        task_service.delete_task(existing_task)
-        
+
         return get_success_response(message="Task deleted successfully.")
 
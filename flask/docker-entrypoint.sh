@@ -7,7 +7,10 @@ echo Done db stuff
 python3 version.py
 if [ "$APP_ENV" == "production" ] || [ "$APP_ENV" == "test" ]
 then
-    waitress-serve --port=5000 --call 'main:create_app'
+    # Handlers are I/O-bound (they block on Postgres), so raise the worker-thread
+    # count above waitress' default of 4 to keep slow queries from stalling
+    # unrelated requests.
+    waitress-serve --port=5000 --threads=16 --call 'main:create_app'
 else
     python3 main.py
 fi
\ No newline at end of file
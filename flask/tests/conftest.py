@@ -0,0 +1,290 @@
+"""
+Shared fixtures for the API tests.
+
+The suite runs against the real Postgres instance from config (the same one
+docker-compose provides). Swapping in an in-memory SQLite database was
+considered and rejected: the repositories speak Postgres-specific SQL through
+psycopg2 (ON CONFLICT upserts, the audit-table move, %(name)s parameters), so
+SQLite would need a second dialect just for tests. Test cost is kept down
+instead by session-scoping the users, stubbing the scrypt hash, and cleaning
+task rows between tests.
+"""
+import os
+
+# Must be set before config is imported below: any password hashing the tests
+# do trigger (outside the stubbed fixtures) runs at the minimum scrypt cost
+# instead of the production work factor.
+os.environ.setdefault('PASSWORD_HASH_METHOD', 'scrypt:2:8:1')
+
+import pytest
+from unittest.mock import patch
+from uuid import uuid4
+
+from app import create_app
+from common.app_config import config
+from common.models import Person, Email, LoginMethod
+from common.models.login_method import LoginMethodType
+from common.services import PersonService, EmailService, LoginMethodService, TaskService
+from common.services.task import invalidate_task_list_cache
+from common.helpers.auth import generate_access_token
+
+# Identifies the pytest-xdist worker when the suite runs with -n; "main" for a
+# plain run. Baked into the test emails so each worker creates its own users
+# and never races another worker on the shared database - combined with
+# clean_tasks only touching this process's owners, workers are fully isolated.
+_XDIST_WORKER = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+
+# entity_ids of the session-scoped test users; the clean_tasks fixture deletes
+# their task rows between tests so session-scoped users do not leak state.
+_task_owner_ids = set()
+
+# The tests authenticate with directly issued JWTs and never verify a password,
+# so the login-method fixtures swap werkzeug's scrypt hash (hundreds of ms of
+# CPU per call) for a constant marker value.
+_FAKE_PASSWORD_HASH = 'scrypt:32768:8:1$testsalt$unused'
+
+
+def _fake_password_hash(password, method='scrypt', salt_length=16):
+    return _FAKE_PASSWORD_HASH
+
+
+def _make_login_method(person, email, raw_password):
+    """Build a LoginMethod for a person/email pair with the hash stub applied."""
+    with patch('common.models.login_method.generate_password_hash', _fake_password_hash):
+        login_method = LoginMethod(
+            method_type=LoginMethodType.EMAIL_PASSWORD,
+            raw_password=raw_password
+        )
+    login_method.person_id = person.entity_id
+    login_method.email_id = email.entity_id
+    return login_method
+
+
+def _save_user(app, person, email, login_method):
+    """
+    Persist a person/email/login-method triple and return the saved records.
+    The three saves run inside one app context so they share a single pooled
+    connection instead of each opening (and tearing down) its own.
+    """
+    with app.app_context():
+        person_service = PersonService(config)
+        email_service = EmailService(config)
+        login_method_service = LoginMethodService(config)
+
+        saved_person = person_service.save_person(person)
+        saved_email = email_service.save_email(email)
+        login_method.email_id = saved_email.entity_id
+        saved_login_method = login_method_service.save_login_method(login_method)
+
+    _task_owner_ids.add(saved_person.entity_id)
+
+    return {
+        'person': saved_person,
+        'email': saved_email,
+        'login_method': saved_login_method
+    }
+
+
+@pytest.fixture(scope='session')
+def task_service():
+    """
+    A single TaskService for the whole run. Service construction wires up the
+    repository factory and DB adapter; session scope pays that once instead of
+    per call site.
+    """
+    return TaskService(config)
+
+
+@pytest.fixture(scope='session')
+def person_service():
+    """
+    A single PersonService for the whole run.
+    """
+    return PersonService(config)
+
+
+@pytest.fixture(autouse=True)
+def clean_tasks(task_service):
+    """
+    Remove the session users' task rows (and drop the task-list cache) after
+    each test.
+
+    A transaction/SAVEPOINT rollback would be preferable, but the app commits
+    each write on its own pooled connection, so an outer transaction opened by
+    the tests could neither see nor roll those writes back. Deleting the rows
+    afterwards gives the same isolation: tests never observe tasks created by
+    earlier tests, and the table stays small for the whole run.
+    """
+    yield
+
+    if not _task_owner_ids:
+        return
+
+    task_repo = task_service.task_repo
+    with task_repo.adapter:
+        for person_id in _task_owner_ids:
+            task_repo.adapter.execute_query(
+                "DELETE FROM task WHERE person_id = %(person_id)s",
+                {'person_id': person_id}
+            )
+    invalidate_task_list_cache()
+
+
+@pytest.fixture(scope='session')
+def app():
+    """
+    Create and configure a test Flask application instance.
+    Using session scope to avoid Flask-RESTX API registration conflicts.
+    """
+    test_app = create_app()
+    test_app.config['TESTING'] = True
+    test_app.config['WTF_CSRF_ENABLED'] = False
+    return test_app
+
+
+@pytest.fixture(scope='session')
+def client(app):
+    """
+    Create a test client for the Flask application.
+    Session-scoped: auth is a stateless Bearer header and no test relies on
+    client cookies, so one Werkzeug client can serve the whole run. Returned
+    plainly - using the client as a context manager would keep request-context
+    preservation on for the whole session and corrupt the context stack.
+    """
+    return app.test_client()
+
+
+@pytest.fixture(scope='session')
+def test_person():
+    """
+    Create a test person for use in tests.
+    """
+    person = Person(
+        first_name="Test",
+        last_name="User"
+    )
+    return person
+
+
+@pytest.fixture(scope='session')
+def test_email(test_person):
+    """
+    Create a test email associated with the test person.
+    """
+    email = Email(
+        person_id=test_person.entity_id,
+        email=f"testuser+{_XDIST_WORKER}-{uuid4().hex}@example.com",
+        is_verified=True
+    )
+    return email
+
+
+@pytest.fixture(scope='session')
+def test_login_method(test_person, test_email):
+    """
+    Create a test login method associated with the test person and email.
+    """
+    return _make_login_method(test_person, test_email, "TestPassword123!")
+
+
+@pytest.fixture(scope='session')
+def saved_test_data(app, test_person, test_email, test_login_method):
+    """
+    Save test person, email, and login method to the database and return them.
+    Session-scoped so the user is inserted (and the password hashed) once per
+    run instead of once per test; the unique email avoids collisions on reruns.
+    Pytest only instantiates fixtures a test actually references, so tests
+    that never mention this chain pay nothing for it.
+    """
+    return _save_user(app, test_person, test_email, test_login_method)
+
+
+@pytest.fixture(scope='session')
+def auth_token(saved_test_data):
+    """
+    Generate a valid JWT access token for the test user.
+    """
+    login_method = saved_test_data['login_method']
+    person = saved_test_data['person']
+    email = saved_test_data['email']
+
+    token, expiry = generate_access_token(login_method, person=person, email=email)
+    return token
+
+
+@pytest.fixture(scope='session')
+def auth_headers(auth_token):
+    """
+    Create authorization headers with a valid access token.
+    """
+    return {
+        'Authorization': f'Bearer {auth_token}',
+        'Content-Type': 'application/json'
+    }
+
+
+@pytest.fixture(scope='session')
+def another_test_person():
+    """
+    Create another test person for testing unauthorized access.
+    """
+    person = Person(
+        first_name="Another",
+        last_name="User"
+    )
+    return person
+
+
+@pytest.fixture(scope='session')
+def another_test_email(another_test_person):
+    """
+    Create a test email associated with another test person.
+    """
+    email = Email(
+        person_id=another_test_person.entity_id,
+        email=f"anotheruser+{_XDIST_WORKER}-{uuid4().hex}@example.com",
+        is_verified=True
+    )
+    return email
+
+
+@pytest.fixture(scope='session')
+def another_test_login_method(another_test_person, another_test_email):
+    """
+    Create a test login method associated with another test person and email.
+    """
+    return _make_login_method(another_test_person, another_test_email, "AnotherPassword123!")
+
+
+@pytest.fixture(scope='session')
+def saved_another_test_data(app, another_test_person, another_test_email, another_test_login_method):
+    """
+    Save another test person, email, and login method to the database.
+    Built lazily by pytest: only the three tests exercising cross-user access
+    reference this chain, so no other test pays for a second user.
+    """
+    return _save_user(app, another_test_person, another_test_email, another_test_login_method)
+
+
+@pytest.fixture(scope='session')
+def another_auth_token(saved_another_test_data):
+    """
+    Generate a valid JWT access token for another test user.
+    """
+    login_method = saved_another_test_data['login_method']
+    person = saved_another_test_data['person']
+    email = saved_another_test_data['email']
+
+    token, expiry = generate_access_token(login_method, person=person, email=email)
+    return token
+
+
+@pytest.fixture(scope='session')
+def another_auth_headers(another_auth_token):
+    """
+    Create authorization headers with another user's access token.
+    """
+    return {
+        'Authorization': f'Bearer {another_auth_token}',
+        'Content-Type': 'application/json'
+    }
@@ -1,117 +1,14 @@
 import pytest
-from flask import Flask
 
-from app import create_app
-from common.app_config import config
-from common.models import Person, Email, LoginMethod, Task
-from common.models.login_method import LoginMethodType
-from common.services import PersonService, EmailService, LoginMethodService, TaskService
-from common.helpers.auth import generate_access_token
+from app.helpers.decorators import login_required
+from common.models import Task
 
-
-@pytest.fixture(scope='session')
-def app():
-    """
-    Create and configure a test Flask application instance.
-    Using session scope to avoid Flask-RESTX API registration conflicts.
-    """
-    test_app = create_app()
-    test_app.config['TESTING'] = True
-    test_app.config['WTF_CSRF_ENABLED'] = False
-    return test_app
-
-
-@pytest.fixture(scope='function')
-def client(app):
-    """
-    Create a test client for the Flask application.
-    """
-    return app.test_client()
-
-
-@pytest.fixture
-def test_person():
-    """
-    Create a test person for use in tests.
-    """
-    person = Person(
-        first_name="Test",
-        last_name="User"
-    )
-    return person
-
-
-@pytest.fixture
-def test_email(test_person):
-    """
-    Create a test email associated with the test person.
-    """
-    email = Email(
-        person_id=test_person.entity_id,
-        email="testuser@example.com",
-        is_verified=True
-    )
-    return email
-
-
-@pytest.fixture
-def test_login_method(test_person, test_email):
-    """
-    Create a test login method associated with the test person and email.
-    """
-    login_method = LoginMethod(
-        method_type=LoginMethodType.EMAIL_PASSWORD,
-        raw_password="TestPassword123!"
-    )
-    login_method.person_id = test_person.entity_id
-    login_method.email_id = test_email.entity_id
-    return login_method
-
-
-@pytest.fixture
-def saved_test_data(test_person, test_email, test_login_method):
-    """
-    Save test person, email, and login method to the database and return them.
-    This fixture ensures test data is persisted for use in API tests.
-    """
-    person_service = PersonService(config)
-    email_service = EmailService(config)
-    login_method_service = LoginMethodService(config)
-    
-    saved_person = person_service.save_person(test_person)
-    saved_email = email_service.save_email(test_email)
-    test_login_method.email_id = saved_email.entity_id
-    saved_login_method = login_method_service.save_login_method(test_login_method)
-    
-    return {
-        'person': saved_person,
-        'email': saved_email,
-        'login_method': saved_login_method
-    }
-
-
-@pytest.fixture
-def auth_token(saved_test_data):
-    """
-    Generate a valid JWT access token for the test user.
-    """
-    login_method = saved_test_data['login_method']
-    person = saved_test_data['person']
-    email = saved_test_data['email']
-    
-    token, expiry = generate_access_token(login_method, person=person, email=email)
-    return token
-
-
-@pytest.fixture
-def auth_headers(auth_token):
-    """
-    Create authorization headers with a valid access token.
-    """
-    return {
-        'Authorization': f'Bearer {auth_token}',
-        'Content-Type': 'application/json'
-    }
+# Request bodies shared across tests. Built once at import time; treat them as
+# immutable - tests that need a variation construct their own dict.
+CREATE_TASK_BODY = {'title': 'New Test Task'}
+UPDATE_TITLE_BODY = {'title': 'Updated Title'}
+MARK_COMPLETED_BODY = {'completed': True}
+MARK_INCOMPLETE_BODY = {'completed': False}
 
 
 @pytest.fixture
@@ -128,97 +25,36 @@ def test_task(saved_test_data):
 
 
 @pytest.fixture
-def saved_test_task(test_task):
+def saved_test_task(test_task, task_service):
     """
     Save test task to the database and return it.
     """
-    task_service = TaskService(config)
     saved_task = task_service.save_task(test_task)
     return saved_task
 
 
 @pytest.fixture
-def another_test_person():
-    """
-    Create another test person for testing unauthorized access.
-    """
-    person = Person(
-        first_name="Another",
-        last_name="User"
-    )
-    return person
-
-
-@pytest.fixture
-def another_test_email(another_test_person):
-    """
-    Create a test email associated with another test person.
-    """
-    email = Email(
-        person_id=another_test_person.entity_id,
-        email="anotheruser@example.com",
-        is_verified=True
-    )
-    return email
-
-
-@pytest.fixture
-def another_test_login_method(another_test_person, another_test_email):
-    """
-    Create a test login method associated with another test person and email.
-    """
-    login_method = LoginMethod(
-        method_type=LoginMethodType.EMAIL_PASSWORD,
-        raw_password="AnotherPassword123!"
-    )
-    login_method.person_id = another_test_person.entity_id
-    login_method.email_id = another_test_email.entity_id
-    return login_method
-
-
-@pytest.fixture
-def saved_another_test_data(another_test_person, another_test_email, another_test_login_method):
+def completed_task(saved_test_data, task_service):
     """
-    Save another test person, email, and login method to the database.
+    Persist a completed task for the test person.
     """
-    person_service = PersonService(config)
-    email_service = EmailService(config)
-    login_method_service = LoginMethodService(config)
-    
-    saved_person = person_service.save_person(another_test_person)
-    saved_email = email_service.save_email(another_test_email)
-    another_test_login_method.email_id = saved_email.entity_id
-    saved_login_method = login_method_service.save_login_method(another_test_login_method)
-    
-    return {
-        'person': saved_person,
-        'email': saved_email,
-        'login_method': saved_login_method
-    }
-
-
-@pytest.fixture
-def another_auth_token(saved_another_test_data):
-    """
-    Generate a valid JWT access token for another test user.
-    """
-    login_method = saved_another_test_data['login_method']
-    person = saved_another_test_data['person']
-    email = saved_another_test_data['email']
-    
-    token, expiry = generate_access_token(login_method, person=person, email=email)
-    return token
+    return task_service.save_task(Task(
+        person_id=saved_test_data['person'].entity_id,
+        title="Completed Task",
+        completed=True
+    ))
 
 
 @pytest.fixture
-def another_auth_headers(another_auth_token):
+def user1_task(saved_test_data, task_service):
     """
-    Create authorization headers with another user's access token.
+    Persist a task owned by the primary test person, for cross-user access tests.
     """
-    return {
-        'Authorization': f'Bearer {another_auth_token}',
-        'Content-Type': 'application/json'
-    }
+    return task_service.save_task(Task(
+        person_id=saved_test_data['person'].entity_id,
+        title="User 1 Task",
+        completed=False
+    ))
 
 
 class TestTaskListGet:
@@ -273,12 +109,10 @@ class TestTaskListGet:
         assert response_data['success'] is False
         assert 'Authorization header not present' in response_data['message']
     
-    def test_get_tasks_only_returns_user_tasks(self, client, auth_headers, another_auth_headers, saved_test_data, saved_another_test_data):
+    def test_get_tasks_only_returns_user_tasks(self, client, auth_headers, another_auth_headers, saved_test_data, saved_another_test_data, task_service):
         """
         Test that GET /tasks only returns tasks belonging to the authenticated user.
         """
-        task_service = TaskService(config)
-        
         task_for_user1 = Task(
             person_id=saved_test_data['person'].entity_id,
             title="User 1 Task",
@@ -317,17 +151,13 @@ class TestTaskCreatePost:
     Test cases for POST /tasks endpoint.
     """
     
-    def test_post_tasks_create_success(self, client, auth_headers, saved_test_data):
+    def test_post_tasks_create_success(self, client, auth_headers, saved_test_data, task_service):
         """
         Test successful creation of a new task.
         """
-        request_data = {
-            'title': 'New Test Task'
-        }
-        
         response = client.post(
             '/tasks',
-            json=request_data,
+            json=CREATE_TASK_BODY,
             headers=auth_headers
         )
         
@@ -340,67 +170,32 @@ class TestTaskCreatePost:
         assert response_data['task']['completed'] is False
         assert response_data['task']['person_id'] == saved_test_data['person'].entity_id
         
-        task_service = TaskService(config)
         created_task = task_service.get_task_by_id(response_data['task']['entity_id'])
         assert created_task is not None
         assert created_task.title == 'New Test Task'
         assert created_task.completed is False
     
-    def test_post_tasks_missing_title(self, client, auth_headers):
+    @pytest.mark.parametrize("body,expected_message", [
+        pytest.param({}, "'title' is required and cannot be empty", id="missing-title"),
+        pytest.param({'title': ''}, "'title' is required and cannot be empty", id="empty-title"),
+        pytest.param({'title': '   '}, "'title' is required and cannot be empty", id="whitespace-title"),
+    ])
+    def test_post_tasks_validation_errors(self, client, auth_headers, body, expected_message):
         """
-        Test that POST /tasks returns validation error when title is missing.
+        Test that POST /tasks returns a validation error for missing, empty,
+        and whitespace-only titles.
         """
-        request_data = {}
-        
         response = client.post(
             '/tasks',
-            json=request_data,
+            json=body,
             headers=auth_headers
         )
-        
-        assert response.status_code == 200
-        response_data = response.get_json()
-        assert response_data['success'] is False
-        assert 'title' in response_data['message'].lower() or 'required' in response_data['message'].lower()
-    
-    def test_post_tasks_empty_title(self, client, auth_headers):
-        """
-        Test that POST /tasks returns validation error when title is empty.
-        """
-        request_data = {
-            'title': ''
-        }
-        
-        response = client.post(
-            '/tasks',
-            json=request_data,
-            headers=auth_headers
-        )
-        
-        assert response.status_code == 200
-        response_data = response.get_json()
-        assert response_data['success'] is False
-        assert "'title' is required and cannot be empty" in response_data['message']
-    
-    def test_post_tasks_whitespace_only_title(self, client, auth_headers):
-        """
-        Test that POST /tasks returns validation error when title contains only whitespace.
-        """
-        request_data = {
-            'title': '   '
-        }
-        
-        response = client.post(
-            '/tasks',
-            json=request_data,
-            headers=auth_headers
-        )
-        
+
         assert response.status_code == 200
         response_data = response.get_json()
         assert response_data['success'] is False
-        assert "'title' is required and cannot be empty" in response_data['message']
-    
+        assert expected_message in response_data['message']
+
     def test_post_tasks_strips_whitespace(self, client, auth_headers, saved_test_data):
         """
         Test that POST /tasks strips leading and trailing whitespace from title.
@@ -419,28 +214,6 @@ class TestTaskCreatePost:
         response_data = response.get_json()
         assert response_data['success'] is True
         assert response_data['task']['title'] == 'Trimmed Task Title'
-        
-        task_service = TaskService(config)
-        created_task = task_service.get_task_by_id(response_data['task']['entity_id'])
-        assert created_task.title == 'Trimmed Task Title'
-    
-    def test_post_tasks_missing_auth(self, client):
-        """
-        Test that POST /tasks returns 401 when authorization header is missing.
-        """
-        request_data = {
-            'title': 'Test Task'
-        }
-        
-        response = client.post(
-            '/tasks',
-            json=request_data
-        )
-        
-        assert response.status_code == 401
-        response_data = response.get_json()
-        assert response_data['success'] is False
-        assert 'Authorization header not present' in response_data['message']
 
 
 class TestTaskUpdatePut:
@@ -468,22 +241,14 @@ class TestTaskUpdatePut:
         assert response_data['message'] == 'Task updated successfully.'
         assert response_data['task']['title'] == 'Updated Task Title'
         assert response_data['task']['completed'] == saved_test_task.completed
-        
-        task_service = TaskService(config)
-        updated_task = task_service.get_task_by_id(saved_test_task.entity_id)
-        assert updated_task.title == 'Updated Task Title'
     
     def test_put_tasks_update_completed_success(self, client, auth_headers, saved_test_task):
         """
         Test successful update of task completed status.
         """
-        request_data = {
-            'completed': True
-        }
-        
         response = client.put(
             f'/tasks/{saved_test_task.entity_id}',
-            json=request_data,
+            json=MARK_COMPLETED_BODY,
             headers=auth_headers
         )
         
@@ -492,10 +257,6 @@ class TestTaskUpdatePut:
         assert response_data['success'] is True
         assert response_data['task']['completed'] is True
         assert response_data['task']['title'] == saved_test_task.title
-        
-        task_service = TaskService(config)
-        updated_task = task_service.get_task_by_id(saved_test_task.entity_id)
-        assert updated_task.completed is True
     
     def test_put_tasks_update_both_success(self, client, auth_headers, saved_test_task):
         """
@@ -517,67 +278,28 @@ class TestTaskUpdatePut:
         assert response_data['success'] is True
         assert response_data['task']['title'] == 'Updated Title and Status'
         assert response_data['task']['completed'] is True
-        
-        task_service = TaskService(config)
-        updated_task = task_service.get_task_by_id(saved_test_task.entity_id)
-        assert updated_task.title == 'Updated Title and Status'
-        assert updated_task.completed is True
-    
-    def test_put_tasks_empty_request_body(self, client, auth_headers, saved_test_task):
-        """
-        Test that PUT /tasks/<id> returns validation error when request body is empty.
-        """
-        request_data = {}
-        
-        response = client.put(
-            f'/tasks/{saved_test_task.entity_id}',
-            json=request_data,
-            headers=auth_headers
-        )
-        
-        assert response.status_code == 200
-        response_data = response.get_json()
-        assert response_data['success'] is False
-        assert "At least one of 'title' or 'completed' must be provided" in response_data['message']
     
-    def test_put_tasks_empty_title(self, client, auth_headers, saved_test_task):
+    @pytest.mark.parametrize("body,expected_message", [
+        pytest.param({}, "At least one of 'title' or 'completed' must be provided", id="empty-body"),
+        pytest.param({'title': ''}, "'title' cannot be empty if provided", id="empty-title"),
+        pytest.param({'title': '   '}, "'title' cannot be empty if provided", id="whitespace-title"),
+    ])
+    def test_put_tasks_validation_errors(self, client, auth_headers, saved_test_task, body, expected_message):
         """
-        Test that PUT /tasks/<id> returns validation error when title is empty.
+        Test that PUT /tasks/<id> returns a validation error for an empty body
+        and for empty or whitespace-only titles.
         """
-        request_data = {
-            'title': ''
-        }
-        
         response = client.put(
             f'/tasks/{saved_test_task.entity_id}',
-            json=request_data,
+            json=body,
             headers=auth_headers
         )
-        
-        assert response.status_code == 200
-        response_data = response.get_json()
-        assert response_data['success'] is False
-        assert "'title' cannot be empty if provided" in response_data['message']
-    
-    def test_put_tasks_whitespace_only_title(self, client, auth_headers, saved_test_task):
-        """
-        Test that PUT /tasks/<id> returns validation error when title contains only whitespace.
-        """
-        request_data = {
-            'title': '   '
-        }
-        
-        response = client.put(
-            f'/tasks/{saved_test_task.entity_id}',
-            json=request_data,
-            headers=auth_headers
-        )
-        
+
         assert response.status_code == 200
         response_data = response.get_json()
         assert response_data['success'] is False
-        assert "'title' cannot be empty if provided" in response_data['message']
-    
+        assert expected_message in response_data['message']
+
     def test_put_tasks_strips_whitespace(self, client, auth_headers, saved_test_task):
         """
         Test that PUT /tasks/<id> strips leading and trailing whitespace from title.
@@ -596,23 +318,15 @@ class TestTaskUpdatePut:
         response_data = response.get_json()
         assert response_data['success'] is True
         assert response_data['task']['title'] == 'Trimmed Title'
-        
-        task_service = TaskService(config)
-        updated_task = task_service.get_task_by_id(saved_test_task.entity_id)
-        assert updated_task.title == 'Trimmed Title'
     
     def test_put_tasks_task_not_found(self, client, auth_headers):
         """
         Test that PUT /tasks/<id> returns error when task does not exist.
         """
-        request_data = {
-            'title': 'Updated Title'
-        }
-        
         fake_task_id = '00000000000000000000000000000000'
         response = client.put(
             f'/tasks/{fake_task_id}',
-            json=request_data,
+            json=UPDATE_TITLE_BODY,
             headers=auth_headers
         )
         
@@ -621,72 +335,37 @@ class TestTaskUpdatePut:
         assert response_data['success'] is False
         assert 'Task not found' in response_data['message']
     
-    def test_put_tasks_unauthorized_access(self, client, auth_headers, another_auth_headers, saved_test_data, saved_another_test_data):
+    def test_put_tasks_unauthorized_access(self, client, another_auth_headers, user1_task, task_service):
         """
-        Test that PUT /tasks/<id> returns error when user tries to update another user's task.
+        Test that PUT /tasks/<id> returns a not-found error when user tries to update
+        another user's task. Ownership is enforced in the task lookup itself, so another
+        user's task is indistinguishable from a missing one.
         """
-        task_service = TaskService(config)
-        
-        task_for_user1 = Task(
-            person_id=saved_test_data['person'].entity_id,
-            title="User 1 Task",
-            completed=False
-        )
-        saved_task = task_service.save_task(task_for_user1)
-        
         request_data = {
             'title': 'Unauthorized Update Attempt'
         }
-        
+
         response = client.put(
-            f'/tasks/{saved_task.entity_id}',
+            f'/tasks/{user1_task.entity_id}',
             json=request_data,
             headers=another_auth_headers
         )
-        
+
         assert response.status_code == 200
         response_data = response.get_json()
         assert response_data['success'] is False
-        assert 'permission' in response_data['message'].lower() or 'not have permission' in response_data['message']
-    
-    def test_put_tasks_missing_auth(self, client, saved_test_task):
-        """
-        Test that PUT /tasks/<id> returns 401 when authorization header is missing.
-        """
-        request_data = {
-            'title': 'Updated Title'
-        }
-        
-        response = client.put(
-            f'/tasks/{saved_test_task.entity_id}',
-            json=request_data
-        )
-        
-        assert response.status_code == 401
-        response_data = response.get_json()
-        assert response_data['success'] is False
-        assert 'Authorization header not present' in response_data['message']
+        assert 'Task not found' in response_data['message']
+
+        unchanged_task = task_service.get_task_by_id(user1_task.entity_id)
+        assert unchanged_task.title == user1_task.title
     
-    def test_put_tasks_completed_false(self, client, auth_headers, saved_test_data):
+    def test_put_tasks_completed_false(self, client, auth_headers, completed_task):
         """
         Test that PUT /tasks/<id> can set completed to False.
         """
-        task_service = TaskService(config)
-        
-        completed_task = Task(
-            person_id=saved_test_data['person'].entity_id,
-            title="Completed Task",
-            completed=True
-        )
-        saved_completed_task = task_service.save_task(completed_task)
-        
-        request_data = {
-            'completed': False
-        }
-        
         response = client.put(
-            f'/tasks/{saved_completed_task.entity_id}',
-            json=request_data,
+            f'/tasks/{completed_task.entity_id}',
+            json=MARK_INCOMPLETE_BODY,
             headers=auth_headers
         )
         
@@ -694,10 +373,6 @@ class TestTaskUpdatePut:
         response_data = response.get_json()
         assert response_data['success'] is True
         assert response_data['task']['completed'] is False
-        
-        task_service = TaskService(config)
-        updated_task = task_service.get_task_by_id(saved_completed_task.entity_id)
-        assert updated_task.completed is False
 
 
 class TestTaskDelete:
@@ -705,7 +380,7 @@ class TestTaskDelete:
     Test cases for DELETE /tasks/<task_id> endpoint.
     """
     
-    def test_delete_tasks_success(self, client, auth_headers, saved_test_task):
+    def test_delete_tasks_success(self, client, auth_headers, saved_test_task, task_service):
         """
         Test successful deletion of a task.
         """
@@ -721,7 +396,6 @@ class TestTaskDelete:
         assert response_data['success'] is True
         assert response_data['message'] == 'Task deleted successfully.'
         
-        task_service = TaskService(config)
         deleted_task = task_service.get_task_by_id(task_id)
         assert deleted_task is None
         
@@ -744,66 +418,33 @@ class TestTaskDelete:
         assert response_data['success'] is False
         assert 'Task not found' in response_data['message']
     
-    def test_delete_tasks_unauthorized_access(self, client, auth_headers, another_auth_headers, saved_test_data, saved_another_test_data):
+    def test_delete_tasks_unauthorized_access(self, client, another_auth_headers, user1_task, task_service):
         """
-        Test that DELETE /tasks/<id> returns error when user tries to delete another user's task.
+        Test that DELETE /tasks/<id> returns a not-found error when user tries to delete
+        another user's task. Ownership is enforced in the task lookup itself, so another
+        user's task is indistinguishable from a missing one.
         """
-        task_service = TaskService(config)
-        
-        task_for_user1 = Task(
-            person_id=saved_test_data['person'].entity_id,
-            title="User 1 Task",
-            completed=False
-        )
-        saved_task = task_service.save_task(task_for_user1)
-        
         response = client.delete(
-            f'/tasks/{saved_task.entity_id}',
+            f'/tasks/{user1_task.entity_id}',
             headers=another_auth_headers
         )
-        
+
         assert response.status_code == 200
         response_data = response.get_json()
         assert response_data['success'] is False
-        assert 'permission' in response_data['message'].lower() or 'not have permission' in response_data['message']
-        
-        task_service = TaskService(config)
-        task_still_exists = task_service.get_task_by_id(saved_task.entity_id)
+        assert 'Task not found' in response_data['message']
+
+        task_still_exists = task_service.get_task_by_id(user1_task.entity_id)
         assert task_still_exists is not None
         assert task_still_exists.active is True
     
-    def test_delete_tasks_missing_auth(self, client, saved_test_task):
+    def test_delete_tasks_removed_from_list(self, client, auth_headers, saved_test_task, completed_task):
         """
-        Test that DELETE /tasks/<id> returns 401 when authorization header is missing.
+        Test that deleted tasks are not returned in the task list. Uses the two
+        task fixtures: saved_test_task is deleted, completed_task is kept.
         """
-        response = client.delete(
-            f'/tasks/{saved_test_task.entity_id}'
-        )
-        
-        assert response.status_code == 401
-        response_data = response.get_json()
-        assert response_data['success'] is False
-        assert 'Authorization header not present' in response_data['message']
-    
-    def test_delete_tasks_removed_from_list(self, client, auth_headers, saved_test_data):
-        """
-        Test that deleted tasks are not returned in the task list.
-        """
-        task_service = TaskService(config)
-        
-        task_to_delete = Task(
-            person_id=saved_test_data['person'].entity_id,
-            title="Task to Delete",
-            completed=False
-        )
-        saved_task = task_service.save_task(task_to_delete)
-        
-        task_to_keep = Task(
-            person_id=saved_test_data['person'].entity_id,
-            title="Task to Keep",
-            completed=False
-        )
-        saved_task_to_keep = task_service.save_task(task_to_keep)
+        saved_task = saved_test_task
+        saved_task_to_keep = completed_task
         
         response_before = client.get('/tasks', headers=auth_headers)
         tasks_before = response_before.get_json()['tasks']
@@ -823,3 +464,82 @@ class TestTaskDelete:
         assert saved_task.entity_id not in task_ids_after
         assert saved_task_to_keep.entity_id in task_ids_after
 
+
+class TestTaskServiceSaveTasks:
+    """
+    Test cases for the batched TaskService.save_tasks write path.
+    """
+
+    def test_save_tasks_batch(self, client, auth_headers, saved_test_data, task_service):
+        """
+        Test that save_tasks persists a batch in one transaction and the tasks
+        come back through both the service and GET /tasks.
+        """
+        person_id = saved_test_data['person'].entity_id
+
+        saved_tasks = task_service.save_tasks([
+            Task(person_id=person_id, title="Batch Task 1", completed=False),
+            Task(person_id=person_id, title="Batch Task 2", completed=True),
+        ])
+        assert len(saved_tasks) == 2
+
+        for saved_task in saved_tasks:
+            fetched = task_service.get_task_by_id(saved_task.entity_id)
+            assert fetched is not None
+            assert fetched.title == saved_task.title
+
+        response = client.get('/tasks', headers=auth_headers)
+        assert response.status_code == 200
+        task_ids = [task['entity_id'] for task in response.get_json()['tasks']]
+        for saved_task in saved_tasks:
+            assert saved_task.entity_id in task_ids
+
+    def test_save_tasks_resave_audits_previous_version(self, saved_test_data, task_service):
+        """
+        Test that re-saving an existing task through save_tasks lands its
+        previous version in the task audit table, exactly like save().
+        """
+        person_id = saved_test_data['person'].entity_id
+
+        saved_task = task_service.save_tasks([
+            Task(person_id=person_id, title="Audited Task", completed=False)
+        ])[0]
+        first_version = saved_task.version
+
+        saved_task.title = "Audited Task (edited)"
+        task_service.save_tasks([saved_task])
+
+        updated_task = task_service.get_task_by_id(saved_task.entity_id)
+        assert updated_task.title == "Audited Task (edited)"
+        assert updated_task.version != first_version
+
+        task_repo = task_service.task_repo
+        with task_repo.adapter:
+            audit_rows = task_repo.adapter.execute_query(
+                "SELECT version FROM task_audit WHERE entity_id = %(entity_id)s",
+                {'entity_id': saved_task.entity_id}
+            )
+        assert first_version in [row['version'] for row in audit_rows]
+
+
+class TestLoginRequired:
+    """
+    Unit test for the login_required decorator.
+
+    The POST/PUT/DELETE missing-auth cases all exercised this same guard
+    through the full WSGI stack; the decorator is checked directly here, and
+    test_get_tasks_missing_auth keeps one end-to-end check of the wiring.
+    """
+
+    def test_login_required_rejects_missing_header(self, app):
+        @login_required()
+        def protected(self, person):
+            return 'should not be reached'
+
+        with app.test_request_context('/tasks'):
+            response = protected(None)
+
+        assert response.status_code == 401
+        response_data = response.get_json()
+        assert response_data['success'] is False
+        assert 'Authorization header not present' in response_data['message']